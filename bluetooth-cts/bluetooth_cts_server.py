@@ -7,28 +7,33 @@ allowing devices like Glance Clock to automatically sync their time.
 """
 
 import argparse
+import asyncio
 import logging
+import signal
+import struct
 import sys
+import time
 from datetime import datetime
-from time import sleep
-import dbus
-import dbus.service
-import dbus.mainloop.glib
-from gi.repository import GLib
+from dbus_fast import BusType, DBusError
+from dbus_fast.aio import MessageBus
+from dbus_fast.service import ServiceInterface, method, dbus_property
+from dbus_fast.constants import PropertyAccess
 import os
-import requests
-import pytz
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 # Constants
 CTS_SERVICE_UUID = "00001805-0000-1000-8000-00805f9b34fb"
 CURRENT_TIME_CHAR_UUID = "00002a2b-0000-1000-8000-00805f9b34fb"
 LOCAL_TIME_INFO_CHAR_UUID = "00002a0f-0000-1000-8000-00805f9b34fb"
 
+# Characteristic value layouts (little endian)
+CURRENT_TIME_STRUCT = struct.Struct("<HBBBBBBBB")
+LOCAL_TIME_INFO_STRUCT = struct.Struct("<bB")
+
 BLUEZ_SERVICE_NAME = "org.bluez"
 GATT_MANAGER_IFACE = "org.bluez.GattManager1"
 LE_ADVERTISING_MANAGER_IFACE = "org.bluez.LEAdvertisingManager1"
 DBUS_OM_IFACE = "org.freedesktop.DBus.ObjectManager"
-DBUS_PROP_IFACE = "org.freedesktop.DBus.Properties"
 GATT_SERVICE_IFACE = "org.bluez.GattService1"
 GATT_CHRC_IFACE = "org.bluez.GattCharacteristic1"
 LE_ADVERTISEMENT_IFACE = "org.bluez.LEAdvertisement1"
@@ -36,31 +41,32 @@ LE_ADVERTISEMENT_IFACE = "org.bluez.LEAdvertisement1"
 logger = logging.getLogger(__name__)
 
 
-class Application(dbus.service.Object):
-    """DBus Application for GATT services."""
+class Application:
+    """GATT application holding the exported services.
+
+    BlueZ discovers the services through ``GetManagedObjects`` on the
+    application path, which dbus-fast answers for every exported object.
+    """
 
     def __init__(self, bus):
         self.path = "/"
+        self.bus = bus
         self.services = []
-        dbus.service.Object.__init__(self, bus, self.path)
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self.path
 
     def add_service(self, service):
         self.services.append(service)
 
-    @dbus.service.method(DBUS_OM_IFACE, out_signature="a{oa{sa{sv}}}")
-    def GetManagedObjects(self):
-        response = {}
+    def export(self):
         for service in self.services:
-            response[service.get_path()] = service.get_properties()
+            self.bus.export(service.get_path(), service)
             for chrc in service.characteristics:
-                response[chrc.get_path()] = chrc.get_properties()
-        return response
+                self.bus.export(chrc.get_path(), chrc)
 
 
-class Service(dbus.service.Object):
+class Service(ServiceInterface):
     """DBus GATT Service."""
 
     PATH_BASE = "/org/bluez/gatt/service"
@@ -71,37 +77,34 @@ class Service(dbus.service.Object):
         self.uuid = uuid
         self.primary = primary
         self.characteristics = []
-        dbus.service.Object.__init__(self, bus, self.path)
-
-    def get_properties(self):
-        return {
-            GATT_SERVICE_IFACE: {
-                "UUID": self.uuid,
-                "Primary": self.primary,
-                "Characteristics": dbus.Array(
-                    [chrc.get_path() for chrc in self.characteristics],
-                    signature="o"
-                ),
-            }
-        }
+        self._characteristic_paths = None
+        ServiceInterface.__init__(self, GATT_SERVICE_IFACE)
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self.path
 
     def add_characteristic(self, characteristic):
         self.characteristics.append(characteristic)
+        self._characteristic_paths = None
+
+    @dbus_property(access=PropertyAccess.READ)
+    def UUID(self) -> "s":
+        return self.uuid
 
-    @dbus.service.method(DBUS_PROP_IFACE, in_signature="s", out_signature="a{sv}")
-    def GetAll(self, interface):
-        if interface != GATT_SERVICE_IFACE:
-            raise dbus.exceptions.DBusException(
-                "org.bluez.Error.InvalidArguments",
-                "Unknown interface"
-            )
-        return self.get_properties()[GATT_SERVICE_IFACE]
+    @dbus_property(access=PropertyAccess.READ)
+    def Primary(self) -> "b":
+        return self.primary
 
+    @dbus_property(access=PropertyAccess.READ)
+    def Characteristics(self) -> "ao":
+        # Read on every GetManagedObjects, the list only changes on add
+        if self._characteristic_paths is None:
+            self._characteristic_paths = [
+                chrc.get_path() for chrc in self.characteristics]
+        return self._characteristic_paths
 
-class Characteristic(dbus.service.Object):
+
+class Characteristic(ServiceInterface):
     """DBus GATT Characteristic."""
 
     def __init__(self, bus, index, uuid, flags, service):
@@ -110,37 +113,32 @@ class Characteristic(dbus.service.Object):
         self.uuid = uuid
         self.service = service
         self.flags = flags
-        dbus.service.Object.__init__(self, bus, self.path)
-
-    def get_properties(self):
-        return {
-            GATT_CHRC_IFACE: {
-                "Service": self.service.get_path(),
-                "UUID": self.uuid,
-                "Flags": self.flags,
-            }
-        }
+        self._service_path = service.get_path()
+        ServiceInterface.__init__(self, GATT_CHRC_IFACE)
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
-
-    @dbus.service.method(DBUS_PROP_IFACE, in_signature="s", out_signature="a{sv}")
-    def GetAll(self, interface):
-        if interface != GATT_CHRC_IFACE:
-            raise dbus.exceptions.DBusException(
-                "org.bluez.Error.InvalidArguments",
-                "Unknown interface"
-            )
-        return self.get_properties()[GATT_CHRC_IFACE]
-
-    @dbus.service.method(GATT_CHRC_IFACE, out_signature="ay")
-    def ReadValue(self, options):
-        logger.debug(f"ReadValue called on {self.uuid}")
+        return self.path
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Service(self) -> "o":
+        return self._service_path
+
+    @dbus_property(access=PropertyAccess.READ)
+    def UUID(self) -> "s":
+        return self.uuid
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Flags(self) -> "as":
+        return self.flags
+
+    @method()
+    def ReadValue(self, options: "a{sv}") -> "ay":
+        logger.debug("ReadValue called on %s", self.uuid)
         return self.read_value(options)
 
     def read_value(self, options):
         """Override this method in subclass."""
-        raise dbus.exceptions.DBusException(
+        raise DBusError(
             "org.bluez.Error.NotSupported",
             "Read not supported"
         )
@@ -149,10 +147,11 @@ class Characteristic(dbus.service.Object):
 class CurrentTimeCharacteristic(Characteristic):
     """Current Time Characteristic - provides current date and time."""
 
-    def __init__(self, bus, index, service):
+    def __init__(self, bus, index, service, tz=None):
         Characteristic.__init__(
             self, bus, index, CURRENT_TIME_CHAR_UUID, ["read"], service
         )
+        self._tz = tz
 
     def read_value(self, options):
         """
@@ -169,108 +168,120 @@ class CurrentTimeCharacteristic(Characteristic):
         - Fractions256 (1 byte, 1/256th of a second)
         - Adjust reason (1 byte)
         """
-
-    # Get local time with timezone awareness
-
-        # Use TZ environment variable for timezone, fallback to system local time
-        timezone = os.environ.get("TZ")
-        if timezone:
-            try:
-                tz = pytz.timezone(timezone)
-                now = datetime.now(tz)
-                logger.info(
-                    f"[CTS] Using timezone: {timezone} | Time: {now.strftime('%Y-%m-%d %H:%M:%S %Z%z')}")
-            except Exception as e:
-                logger.warning(
-                    f"[CTS] Invalid timezone '{timezone}', using system local time. Error: {e}")
-                now = datetime.now().astimezone()
-        else:
-            now = datetime.now().astimezone()
-            logger.info(
-                f"[CTS] Using system local time: {now.strftime('%Y-%m-%d %H:%M:%S %Z%z')}")
+        # Timezone is resolved once at startup, fallback to system local time
+        now = datetime.now(self._tz) if self._tz else datetime.now().astimezone()
 
         # Convert to CTS format
-        year_low = now.year & 0xFF
-        year_high = (now.year >> 8) & 0xFF
-        month = now.month
-        day = now.day
-        hours = now.hour
-        minutes = now.minute
-        seconds = now.second
         day_of_week = now.isoweekday()  # 1=Monday, 7=Sunday
-        fractions = int((now.microsecond / 1000000.0) * 256)
+        fractions = (now.microsecond << 8) // 1_000_000
         adjust_reason = 0  # No adjustment
 
-        value = [
-            dbus.Byte(year_low),
-            dbus.Byte(year_high),
-            dbus.Byte(month),
-            dbus.Byte(day),
-            dbus.Byte(hours),
-            dbus.Byte(minutes),
-            dbus.Byte(seconds),
-            dbus.Byte(day_of_week),
-            dbus.Byte(fractions),
-            dbus.Byte(adjust_reason),
-        ]
-
-        logger.info(
-            f"[CTS] BLE time sent: {now.strftime('%Y-%m-%d %H:%M:%S %Z%z')} (Day {day_of_week})"
+        value = CURRENT_TIME_STRUCT.pack(
+            now.year,
+            now.month,
+            now.day,
+            now.hour,
+            now.minute,
+            now.second,
+            day_of_week,
+            fractions,
+            adjust_reason,
         )
 
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[CTS] BLE time sent: %s (Day %d)",
+                        now.strftime('%Y-%m-%d %H:%M:%S %Z%z'), day_of_week)
+
         return value
 
 
 class LocalTimeInfoCharacteristic(Characteristic):
     """Local Time Information Characteristic - provides timezone info."""
 
-    def __init__(self, bus, index, service):
+    def __init__(self, bus, index, service, tz=None):
         Characteristic.__init__(
             self, bus, index, LOCAL_TIME_INFO_CHAR_UUID, ["read"], service
         )
-
-    def read_value(self, options):
+        self._tz = tz
+        self._value = self._compute()
+        self._refresh_task = None
+
+    def start(self):
+        """Start refreshing the cached value, must run inside the event loop."""
+        # Periodic work runs on the event loop that dispatches D-Bus calls,
+        # not in a polling thread
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    def stop(self):
+        """Stop refreshing the cached value."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _compute(self):
         """
-        Return local time information.
+        Compute local time information.
 
         Format (2 bytes):
         - Time zone (1 byte, offset in 15-minute increments from UTC, -48 to +56)
         - DST offset (1 byte, 0=standard time, 2=half hour, 4=daylight, 8=double daylight)
         """
-        now = datetime.now().astimezone()
+        now = datetime.now(self._tz) if self._tz else datetime.now().astimezone()
         offset = now.utcoffset()
-        if offset is not None:
-            utc_offset = offset.total_seconds()
-        else:
-            utc_offset = 0
-        # Convert to 15-minute increments
-        timezone_offset = int(utc_offset / 900)
-        dst_offset = 0  # Standard time (you could detect DST here if needed)
-
-        value = [
-            dbus.Byte(timezone_offset & 0xFF),
-            dbus.Byte(dst_offset),
-        ]
-
-        logger.info(
-            f"[CTS] BLE timezone offset sent: UTC{utc_offset/3600:+.1f}h (offset {timezone_offset}, DST {dst_offset})")
-        return value
+        utc_offset = offset.total_seconds() if offset is not None else 0
+        # Zones with a negative DST rule (e.g. Europe/Dublin) report standard time
+        dst = now.dst()
+        dst_seconds = max(dst.total_seconds(), 0) if dst is not None else 0
+
+        # Convert to 15-minute increments, time zone excludes DST
+        timezone_offset = int((utc_offset - dst_seconds) / 900)
+        dst_offset = int(dst_seconds / 900)
+
+        logger.debug(
+            "[CTS] Local time information: UTC%+.1fh (offset %d, DST %d)",
+            utc_offset / 3600, timezone_offset, dst_offset)
+        return LOCAL_TIME_INFO_STRUCT.pack(timezone_offset, dst_offset)
+
+    async def _refresh(self):
+        """Recompute the cached value every 15 minutes for DST changes."""
+        # Aligned to quarter hours, the granularity of the CTS offset fields,
+        # so zones switching at :30 or :45 UTC are picked up on time
+        while True:
+            await asyncio.sleep(900 - time.time() % 900)
+            value = self._compute()
+            if value != self._value:
+                logger.info("[CTS] Local time information changed: %s",
+                            value.hex())
+                self._value = value
+
+    def read_value(self, options):
+        """Return the cached local time information."""
+        logger.debug("[CTS] BLE timezone offset sent: %r", self._value)
+        return self._value
 
 
 class CTSService(Service):
     """Current Time Service."""
 
-    def __init__(self, bus, index):
+    def __init__(self, bus, index, tz=None):
         Service.__init__(self, bus, index, CTS_SERVICE_UUID, True)
 
         # Add Current Time characteristic
-        self.add_characteristic(CurrentTimeCharacteristic(bus, 0, self))
+        self.add_characteristic(CurrentTimeCharacteristic(bus, 0, self, tz=tz))
 
         # Add Local Time Information characteristic
-        self.add_characteristic(LocalTimeInfoCharacteristic(bus, 1, self))
+        self.local_time_info = LocalTimeInfoCharacteristic(bus, 1, self, tz=tz)
+        self.add_characteristic(self.local_time_info)
 
+    def start(self):
+        self.local_time_info.start()
 
-class Advertisement(dbus.service.Object):
+    def stop(self):
+        self.local_time_info.stop()
+
+
+class Advertisement(ServiceInterface):
     """BLE Advertisement."""
 
     PATH_BASE = "/org/bluez/gatt/advertisement"
@@ -279,70 +290,82 @@ class Advertisement(dbus.service.Object):
         self.path = f"{self.PATH_BASE}{index}"
         self.bus = bus
         self.ad_type = advertising_type
-        self.service_uuids = None
-        self.local_name = None
+        self.service_uuids = []
+        self.local_name = ""
         self.include_tx_power = False
-        dbus.service.Object.__init__(self, bus, self.path)
-
-    def get_properties(self):
-        properties = dict()
-        properties["Type"] = self.ad_type
-        if self.service_uuids is not None:
-            properties["ServiceUUIDs"] = dbus.Array(
-                self.service_uuids, signature="s")
-        if self.local_name is not None:
-            properties["LocalName"] = dbus.String(self.local_name)
-        if self.include_tx_power:
-            properties["IncludeTxPower"] = dbus.Boolean(self.include_tx_power)
-        return {LE_ADVERTISEMENT_IFACE: properties}
+        ServiceInterface.__init__(self, LE_ADVERTISEMENT_IFACE)
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self.path
 
     def add_service_uuid(self, uuid):
-        if not self.service_uuids:
-            self.service_uuids = []
         self.service_uuids.append(uuid)
 
     def add_local_name(self, name):
         self.local_name = name
 
-    @dbus.service.method(DBUS_PROP_IFACE, in_signature="s", out_signature="a{sv}")
-    def GetAll(self, interface):
-        if interface != LE_ADVERTISEMENT_IFACE:
-            raise dbus.exceptions.DBusException(
-                "org.bluez.Error.InvalidArguments",
-                "Unknown interface"
-            )
-        return self.get_properties()[LE_ADVERTISEMENT_IFACE]
+    @dbus_property(access=PropertyAccess.READ)
+    def Type(self) -> "s":
+        return self.ad_type
+
+    @dbus_property(access=PropertyAccess.READ)
+    def ServiceUUIDs(self) -> "as":
+        return self.service_uuids
 
-    @dbus.service.method(LE_ADVERTISEMENT_IFACE, in_signature="", out_signature="")
+    @dbus_property(access=PropertyAccess.READ)
+    def LocalName(self) -> "s":
+        return self.local_name
+
+    @dbus_property(access=PropertyAccess.READ)
+    def IncludeTxPower(self) -> "b":
+        return self.include_tx_power
+
+    @method()
     def Release(self):
         logger.info("Advertisement released")
 
 
-def register_advertisement(advertisement, adapter_path, bus):
+def resolve_timezone():
+    """Resolve the TZ environment variable, or None for system local time."""
+    timezone = os.environ.get("TZ")
+    if not timezone:
+        logger.info("[CTS] Using system local time")
+        return None
+
+    try:
+        tz = ZoneInfo(timezone)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        logger.warning(
+            f"[CTS] Invalid timezone '{timezone}', using system local time. Error: {e}")
+        return None
+
+    logger.info(f"[CTS] Using timezone: {timezone}")
+    return tz
+
+
+async def get_interface(bus, path, interface):
+    """Return a proxy for a BlueZ interface on the given object path."""
+    introspection = await bus.introspect(BLUEZ_SERVICE_NAME, path)
+    proxy = bus.get_proxy_object(BLUEZ_SERVICE_NAME, path, introspection)
+    return proxy.get_interface(interface)
+
+
+async def register_advertisement(advertisement, adapter_path, bus):
     """Register the BLE advertisement."""
-    adapter = dbus.Interface(
-        bus.get_object(BLUEZ_SERVICE_NAME, adapter_path),
-        LE_ADVERTISING_MANAGER_IFACE
-    )
+    adapter = await get_interface(
+        bus, adapter_path, LE_ADVERTISING_MANAGER_IFACE)
 
-    adapter.RegisterAdvertisement(
-        advertisement.get_path(), {},
-        reply_handler=lambda: logger.info("Advertisement registered"),
-        error_handler=lambda error: logger.error(
-            f"Failed to register advertisement: {error}")
-    )
+    try:
+        await adapter.call_register_advertisement(advertisement.get_path(), {})
+        logger.info("Advertisement registered")
+    except DBusError as error:
+        logger.error(f"Failed to register advertisement: {error}")
 
 
-def find_adapter(bus):
+async def find_adapter(bus):
     """Find the first available Bluetooth adapter."""
-    remote_om = dbus.Interface(
-        bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-        DBUS_OM_IFACE
-    )
-    objects = remote_om.GetManagedObjects()
+    remote_om = await get_interface(bus, "/", DBUS_OM_IFACE)
+    objects = await remote_om.call_get_managed_objects()
 
     for path, ifaces in objects.items():
         adapter = ifaces.get("org.bluez.Adapter1")
@@ -352,73 +375,40 @@ def find_adapter(bus):
     return None
 
 
-def register_application(app, adapter_path, bus):
+async def register_application(app, adapter_path, bus):
     """Register the GATT application."""
-    adapter = dbus.Interface(
-        bus.get_object(BLUEZ_SERVICE_NAME, adapter_path),
-        GATT_MANAGER_IFACE
-    )
-
-    adapter.RegisterApplication(
-        app.get_path(), {},
-        reply_handler=lambda: logger.info("GATT application registered"),
-        error_handler=lambda error: logger.error(
-            f"Failed to register application: {error}")
-    )
+    adapter = await get_interface(bus, adapter_path, GATT_MANAGER_IFACE)
 
+    try:
+        await adapter.call_register_application(app.get_path(), {})
+        logger.info("GATT application registered")
+    except DBusError as error:
+        logger.error(f"Failed to register application: {error}")
 
-def main():
-    # Log the detected local time and timezone at startup
-    timezone = os.environ.get("TZ")
 
-    if timezone:
-        try:
-            tz = pytz.timezone(timezone)
-            local_now = datetime.now(tz)
-            logger.info(
-                f"[CTS] Startup time: {local_now.strftime('%Y-%m-%d %H:%M:%S %Z%z')} (timezone: {timezone})")
-        except Exception as e:
-            local_now = datetime.now().astimezone()
-            logger.warning(
-                f"[CTS] Invalid timezone '{timezone}' at startup, using system local time. Error: {e}")
-            logger.info(
-                f"[CTS] Startup time: {local_now.strftime('%Y-%m-%d %H:%M:%S %Z%z')}")
-    else:
-        local_now = datetime.now().astimezone()
-        logger.info(
-            f"[CTS] Startup time: {local_now.strftime('%Y-%m-%d %H:%M:%S %Z%z')}")
-    parser = argparse.ArgumentParser(
-        description="Bluetooth CTS Time Sync Server")
-    parser.add_argument(
-        "--device-name", default="HomeAssistant-CTS", help="Bluetooth device name")
-    parser.add_argument("--log-level", default="info",
-                        choices=["debug", "info", "warning", "error"])
-    args = parser.parse_args()
+async def unregister(app, advertisement, adapter_path, bus):
+    """Unregister the GATT application and advertisement from BlueZ."""
+    try:
+        adv_manager = await get_interface(
+            bus, adapter_path, LE_ADVERTISING_MANAGER_IFACE)
+        await adv_manager.call_unregister_advertisement(advertisement.get_path())
+    except DBusError as error:
+        logger.warning(f"Failed to unregister advertisement: {error}")
 
-    # Setup logging
-    log_level = getattr(logging, args.log_level.upper())
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    try:
+        gatt_manager = await get_interface(
+            bus, adapter_path, GATT_MANAGER_IFACE)
+        await gatt_manager.call_unregister_application(app.get_path())
+    except DBusError as error:
+        logger.warning(f"Failed to unregister application: {error}")
 
-    logger.info("=" * 60)
-    logger.info("Bluetooth CTS Time Sync Server")
-    logger.info("=" * 60)
-    logger.info(f"Device name: {args.device_name}")
-    logger.info(f"Log level: {args.log_level}")
-    # Log the detected local time and timezone at startup
-    local_now = datetime.now().astimezone()
-    logger.info(
-        f"Startup local time: {local_now.strftime('%Y-%m-%d %H:%M:%S %Z%z')} | tzinfo: {local_now.tzinfo}")
 
+async def main_async(args, tz):
     # Initialize DBus
-    dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
-    bus = dbus.SystemBus()
+    bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
 
     # Find Bluetooth adapter
-    adapter_path = find_adapter(bus)
+    adapter_path = await find_adapter(bus)
     if not adapter_path:
         logger.error("No Bluetooth adapter found!")
         return 1
@@ -427,28 +417,85 @@ def main():
 
     # Create and register GATT application
     app = Application(bus)
-    cts_service = CTSService(bus, 0)
+    cts_service = CTSService(bus, 0, tz=tz)
     app.add_service(cts_service)
+    app.export()
+    cts_service.start()
 
     logger.info("Registering Current Time Service...")
-    register_application(app, adapter_path, bus)
+    await register_application(app, adapter_path, bus)
 
     # Create and register advertisement
     adv = Advertisement(bus, 0, "peripheral")
     adv.add_service_uuid(CTS_SERVICE_UUID)
     adv.add_local_name(args.device_name)
     adv.include_tx_power = True
+    bus.export(adv.get_path(), adv)
 
     logger.info("Registering advertisement...")
-    register_advertisement(adv, adapter_path, bus)
+    await register_advertisement(adv, adapter_path, bus)
 
-    # Start main loop
+    # Serve requests until stopped or the bus goes away
     logger.info("CTS server is running - devices can now sync time")
     logger.info("Press Ctrl+C to stop")
 
-    mainloop = GLib.MainLoop()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    stop_task = asyncio.create_task(stop.wait())
+    disconnect_task = asyncio.create_task(bus.wait_for_disconnect())
+    await asyncio.wait(
+        [stop_task, disconnect_task], return_when=asyncio.FIRST_COMPLETED)
+
+    if disconnect_task.done():
+        error = disconnect_task.exception()
+        if error is not None:
+            logger.error(f"Lost connection to the system bus: {error}")
+        else:
+            logger.error("Lost connection to the system bus")
+        cts_service.stop()
+        return 1
+
+    logger.info("Shutting down...")
+    cts_service.stop()
+    await unregister(app, adv, adapter_path, bus)
+    bus.disconnect()
+
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bluetooth CTS Time Sync Server")
+    parser.add_argument(
+        "--device-name", default="HomeAssistant-CTS", help="Bluetooth device name")
+    parser.add_argument("--log-level", default="info",
+                        choices=["debug", "info", "warning", "error"])
+    args = parser.parse_args()
+
+    # Setup logging
+    log_level = getattr(logging, args.log_level.upper())
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+    logger.info("=" * 60)
+    logger.info("Bluetooth CTS Time Sync Server")
+    logger.info("=" * 60)
+    logger.info(f"Log level: {args.log_level}")
+
+    # Log the detected local time and timezone at startup
+    tz = resolve_timezone()
+    local_now = datetime.now(tz) if tz else datetime.now().astimezone()
+    logger.info("Startup: device=%s tz=%s time=%s",
+                args.device_name, local_now.tzinfo, local_now.isoformat())
+
     try:
-        mainloop.run()
+        return asyncio.run(main_async(args, tz))
     except KeyboardInterrupt:
         logger.info("Shutting down...")
 
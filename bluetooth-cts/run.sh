@@ -63,5 +63,12 @@ bashio::log.info "Configuring Bluetooth adapter..."
 # Give bluetoothctl time to complete
 sleep 2
 
+# Prefer PyPy when it is installed and can import dbus-fast
+if command -v pypy3 > /dev/null && pypy3 -c 'import dbus_fast' 2> /dev/null; then
+    PYTHON=pypy3
+else
+    PYTHON=python3
+fi
+
 bashio::log.info "Starting Current Time Service..."
-exec python3 /bluetooth_cts_server.py --device-name "${DEVICE_NAME}" --log-level "${LOG_LEVEL}"
\ No newline at end of file
+exec "${PYTHON}" /bluetooth_cts_server.py --device-name "${DEVICE_NAME}" --log-level "${LOG_LEVEL}"
\ No newline at end of file